@@ -0,0 +1,228 @@
+"""
+Fill in production_year and num_performances for each show in the Tony
+dataset by looking the show up on IBDB.
+
+Reads the Tony CSV, scrapes the IBDB production page for every show that is
+still missing either field, and writes the updated CSV back out. Failed
+shows are retried in additional rounds until nothing is left or no progress
+is being made.
+"""
+
+import asyncio
+import atexit
+import functools
+import json
+import re
+import threading
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2]); a
+# plain httpx install still works over HTTP/1.1.
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+from advanced_ibdb_scraper import AdvancedIBDBScraper
+
+INPUT_FILE = 'data/tony_shows_with_producers.csv'
+CHECKPOINT_FILE = 'data/tony_outcomes_checkpoint.jsonl'
+URL_CACHE_FILE = 'data/url_cache.json'
+MAX_CONCURRENCY = 16
+
+# URL resolution goes through one warm cloudscraper session (its shelf cache
+# and rate limiter live there); the session is not thread-safe, so resolution
+# calls dispatched to worker threads are serialized with this lock.
+_resolver = None
+_resolver_lock = threading.Lock()
+
+try:
+    with open(URL_CACHE_FILE) as _f:
+        _url_cache = json.load(_f)
+except (FileNotFoundError, json.JSONDecodeError):
+    _url_cache = {}
+
+
+def _save_url_cache():
+    Path(URL_CACHE_FILE).parent.mkdir(parents=True, exist_ok=True)
+    with open(URL_CACHE_FILE, 'w') as f:
+        json.dump(_url_cache, f, indent=2)
+
+
+atexit.register(_save_url_cache)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_ibdb_url(show_name):
+    """Resolve a show name to its IBDB production URL, caching successes.
+
+    Raises LookupError when no URL is found: lru_cache doesn't cache
+    exceptions, so failed lookups are retried in later rounds while
+    successful ones never hit the network again.
+    """
+    key = show_name.lower().strip()
+    url = _url_cache.get(key)
+    if url is None:
+        with _resolver_lock:
+            url = (_resolver.search_ibdb_directly(show_name)
+                   or _resolver.search_duckduckgo_for_ibdb(show_name)
+                   or _resolver.search_google_for_ibdb(show_name))
+    if url is None:
+        raise LookupError(f"no IBDB URL found for '{show_name}'")
+    _url_cache[key] = url
+    return url
+
+
+# Both labels appear verbatim in the raw IBDB markup, in the production
+# sidebar near the top of the page, so a single alternation finds them in
+# one scan instead of two.
+_FIELDS_RE = re.compile(
+    r'Opening Night:\s*\w+\s+\d+,\s+(\d{4})|Performances:\s*(\d+)', re.IGNORECASE)
+
+
+def extract_performances_and_year(page_text):
+    """Pull the opening-night year and performance count out of IBDB page text."""
+    production_year = None
+    num_performances = None
+
+    # finditer is lazy and both fields sit near the top of the page, so
+    # the early return keeps the scan short without slicing the text into
+    # windows (a fixed split can truncate a match straddling the cut).
+    for match in _FIELDS_RE.finditer(page_text):
+        if match.group(1) is not None and production_year is None:
+            production_year = int(match.group(1))
+        elif match.group(2) is not None and num_performances is None:
+            num_performances = int(match.group(2))
+        if production_year is not None and num_performances is not None:
+            break
+
+    return production_year, num_performances
+
+
+async def search_and_scrape_show(client, show_name, show_id):
+    """Resolve a show's IBDB page and extract its year and performance count.
+
+    Returns (production_year, num_performances); either may be None when the
+    show could not be resolved or the page didn't contain the field.
+    """
+    for attempt in range(1, 4):
+        try:
+            try:
+                ibdb_url = await asyncio.to_thread(resolve_ibdb_url, show_name)
+            except LookupError:
+                print(f"  [{show_id}] no IBDB URL found for '{show_name}'")
+                return None, None
+
+            response = await client.get(ibdb_url, timeout=30)
+            response.raise_for_status()
+            return extract_performances_and_year(response.text)
+        except Exception as exc:
+            print(f"  [{show_id}] attempt {attempt} failed for '{show_name}': {exc}")
+    return None, None
+
+
+def _fold_checkpoints(df):
+    """Apply any checkpointed results from an interrupted run to the frame."""
+    try:
+        with open(CHECKPOINT_FILE) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return
+    by_show_id = df['show_id'].astype(str)
+    for record in records:
+        matches = df.index[by_show_id == record['show_id']]
+        for idx in matches:
+            if record['production_year'] is not None:
+                df.at[idx, 'production_year'] = record['production_year']
+            if record['num_performances'] is not None:
+                df.at[idx, 'num_performances'] = record['num_performances']
+
+
+async def _scrape_all(df):
+    global _resolver
+    _resolver = resolver = AdvancedIBDBScraper()
+    # IBDB page fetches run through httpx: dozens of in-flight requests are
+    # multiplexed on the event loop and share one connection pool, with the
+    # warm session's Cloudflare cookies injected so Cloudflare lets them by.
+    limits = httpx.Limits(max_connections=32)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def scrape_one(client, idx, show_name, show_id):
+        async with semaphore:
+            year, performances = await search_and_scrape_show(
+                client, show_name, show_id)
+        return idx, show_id, year, performances
+
+    async with httpx.AsyncClient(http2=h2 is not None, limits=limits,
+                                 cookies=resolver.export_cookies(),
+                                 headers={'User-Agent': 'Mozilla/5.0'},
+                                 follow_redirects=True) as client:
+        round_num = 0
+        prev_remaining = None
+        while True:
+            round_num += 1
+            mask = df['num_performances'].isna() | df['production_year'].isna()
+            todo = [(idx, df.at[idx, 'show_name'], df.at[idx, 'show_id'])
+                    for idx in df.index[mask]]
+            if not todo:
+                break
+            # Progress means the todo set shrank. Shows whose pages only
+            # ever yield one of the two fields stay in the mask forever,
+            # so counting their re-scrapes as progress would loop without
+            # end once any show fails persistently.
+            if prev_remaining is not None and len(todo) >= prev_remaining:
+                print(f"No progress in round {round_num - 1}; "
+                      f"{len(todo)} shows still incomplete")
+                break
+            prev_remaining = len(todo)
+
+            scraped = 0
+            failed = 0
+            # Append-only JSONL checkpoint: one small record per completed
+            # show instead of rewriting the whole CSV as results come in.
+            with open(CHECKPOINT_FILE, 'a') as checkpoint:
+                tasks = [scrape_one(client, idx, name, sid)
+                         for idx, name, sid in todo]
+                for coro in asyncio.as_completed(tasks):
+                    idx, show_id, year, performances = await coro
+                    if year is not None:
+                        df.at[idx, 'production_year'] = year
+                    if performances is not None:
+                        df.at[idx, 'num_performances'] = performances
+                    if year is None and performances is None:
+                        failed += 1
+                    else:
+                        scraped += 1
+                    checkpoint.write(json.dumps({
+                        'show_id': str(show_id),
+                        'production_year': year,
+                        'num_performances': performances,
+                    }) + '\n')
+            df.to_csv(INPUT_FILE, index=False)
+
+            print(f"Round {round_num}: {scraped} scraped, {failed} still failing")
+
+
+def main():
+    df = pd.read_csv(INPUT_FILE)
+    if 'production_year' not in df.columns:
+        df['production_year'] = pd.NA
+    if 'num_performances' not in df.columns:
+        df['num_performances'] = pd.NA
+    _fold_checkpoints(df)
+
+    asyncio.run(_scrape_all(df))
+
+    has_performances = df['num_performances'].notna().to_numpy()
+    has_year = df['production_year'].notna().to_numpy()
+    print("\nSummary:")
+    print(f"  shows with num_performances: {has_performances.sum()}")
+    print(f"  shows with production_year:  {has_year.sum()}")
+    print(f"  shows with both:             {(has_performances & has_year).sum()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,619 @@
+"""
+Advanced IBDB scraper for Broadway producer data.
+
+Uses cloudscraper to get past Cloudflare on ibdb.com, finds the IBDB
+production page for a show via a Google search, and pulls the "Produced by"
+credits out of the page. IBDB markup varies a lot between productions, so
+the parser tries a few strategies and merges whatever they find.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import itertools
+import random
+import re
+import shelve
+import time
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import quote_plus, unquote, urlparse
+
+import cloudscraper
+
+# aiohttp is only needed by the async front end; the sync scraper works
+# without it.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# When requests-cache is installed, every GET through the cloudscraper
+# sessions is cached in SQLite, making repeat sweeps near-instant. The
+# cache has to be mixed into the session class itself: install_cache()
+# patches requests.Session after CloudScraper has already subclassed the
+# original, so the monkeypatch would never reach these sessions.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+else:
+    class _CachedCloudScraper(requests_cache.CacheMixin,
+                              cloudscraper.CloudScraper):
+        """CloudScraper with a requests-cache backend mixed in."""
+
+# selectolax parses and walks the tree entirely in C and is markedly faster
+# than bs4/lxml on IBDB's dense credit pages. Prefer the Lexbor engine, fall
+# back to the Modest engine on older selectolax builds, and to the lxml
+# streaming walk when selectolax isn't installed at all.
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+# Flip to False to force the lxml fallback walk when debugging parser diffs.
+USE_SELECTOLAX = True
+
+CACHE_PATH = 'data/ibdb_url_cache.db'
+PARSE_CACHE_PATH = 'data/ibdb_parse_cache.db'
+HTTP_CACHE_PATH = 'data/ibdb_http_cache'
+# Cached IBDB pages are served without touching the network until this old,
+# then revalidated with a conditional GET.
+REVALIDATE_AFTER = 30 * 86400
+
+# Patterns used in the per-element parsing loops, compiled once at import.
+_PERSON_HREF = re.compile(r'/person/|/organization/')
+_PRODUCER_WORD = re.compile(r'\bproducer\b')
+_DDG_UDDG = re.compile(r'uddg=([^&"]+)')
+_PRODUCED_BY_RE = re.compile(
+    r'Produced by\s+(.+?)(?:\n\n|Credits|Cast|Orchestra|Production Staff|$)',
+    re.DOTALL | re.IGNORECASE)
+_AND_RE = re.compile(r'\s+and\s+')
+_PAREN_RE = re.compile(r'\s*\([^)]+\)')
+
+# Credit-role labels that show up in "Produced by" blocks but aren't names.
+_SKIP_TERMS = frozenset({
+    'artistic director', 'executive director', 'managing director',
+    'general manager', 'producer', 'production',
+})
+
+# URL harvesting runs straight over the raw response text: one regex scan
+# instead of building a DOM for (often hundreds-of-KB) result pages.
+_IBDB_SEARCH_RESULT_RE = re.compile(r'href="(/broadway-production/[^"]+)"')
+_GOOGLE_RESULT_RE = re.compile(
+    r'href="/url\?q=(https?://(?:www\.)?ibdb\.com/broadway-production/[^"&]+)')
+_DIRECT_IBDB_RE = re.compile(
+    r'href="(https?://(?:www\.)?ibdb\.com/broadway-production/[^"]+)"')
+
+
+def _normalize_show_name(show_name):
+    return show_name.lower().strip()
+
+
+class RateLimiter:
+    """Sleep a random interval between requests so we look less like a bot.
+
+    Delays are tracked per host: back-to-back requests to different hosts
+    (an IBDB hit followed by a search-engine fallback) don't stack their
+    politeness budgets, and a request that arrives after the host's delay
+    has already elapsed goes straight through.
+    """
+
+    def __init__(self, min_delay=3.0, max_delay=8.0):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._last_request_times = {}
+
+    def wait(self, host=''):
+        elapsed = time.time() - self._last_request_times.get(host, 0.0)
+        if elapsed < self.min_delay:
+            delay = random.uniform(self.min_delay, self.max_delay)
+            if elapsed < delay:
+                time.sleep(delay - elapsed)
+        self._last_request_times[host] = time.time()
+
+
+def _create_scraper(**kwargs):
+    """Build a cloudscraper session, cache-backed when requests-cache exists."""
+    if requests_cache is None:
+        return cloudscraper.create_scraper(**kwargs)
+    Path(HTTP_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+    return _CachedCloudScraper(
+        cache_name=HTTP_CACHE_PATH, backend='sqlite',
+        expire_after=timedelta(days=30), allowable_methods=['GET'],
+        **kwargs)
+
+
+class AdvancedIBDBScraper:
+    """Finds IBDB production pages and extracts producer credits from them."""
+
+    def __init__(self, shared_cookies=None):
+        # A fresh cloudscraper session waits up to `delay` seconds solving the
+        # Cloudflare challenge on its first request. Sessions seeded with the
+        # cf_clearance cookie from an already-warm scraper skip that entirely,
+        # so only the first instance pays the challenge cost.
+        self.scraper = _create_scraper(
+            browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True},
+            delay=0 if shared_cookies else 10,
+        )
+        if shared_cookies:
+            self.scraper.cookies.update(shared_cookies)
+        else:
+            self._warm_up()
+        # Cloudflare caps concurrent requests per browser fingerprint
+        # ("Concurrent request limit reached"); rotating a few profiles
+        # spreads the load across fingerprints. The extra sessions reuse the
+        # warm session's clearance cookies, so they never solve a challenge.
+        self._scrapers = [self.scraper]
+        for browser, platform in [('firefox', 'windows'), ('chrome', 'darwin'),
+                                  ('firefox', 'linux')]:
+            scraper = _create_scraper(
+                browser={'browser': browser, 'platform': platform,
+                         'desktop': True},
+                delay=0,
+            )
+            scraper.cookies.update(self.scraper.cookies.get_dict())
+            self._scrapers.append(scraper)
+        self._rr = itertools.cycle(self._scrapers)
+        self.rate_limiter = RateLimiter()
+        # Persistent cache: resolved IBDB URLs keyed by normalized show name,
+        # and raw page HTML keyed by URL. IBDB pages for past Tony shows are
+        # effectively immutable, so entries never expire.
+        Path(CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        self.cache = shelve.open(CACHE_PATH)
+        atexit.register(self.cache.close)
+        # In-memory memo in front of the shelf: repeat lookups for the same
+        # normalized show name within a run never touch the dbm file.
+        self._url_memo = {}
+        # Parse results keyed by body hash, so identical HTML bodies
+        # (revalidated 304s, re-runs over the page cache) skip the parse.
+        self._parse_cache = shelve.open(PARSE_CACHE_PATH)
+        atexit.register(self._parse_cache.close)
+
+    def _cached_url(self, cache_key):
+        url = self._url_memo.get(cache_key)
+        if url is None:
+            url = self.cache.get(cache_key)
+            if url is not None:
+                self._url_memo[cache_key] = url
+        return url
+
+    def _store_url(self, cache_key, url):
+        self._url_memo[cache_key] = url
+        self.cache[cache_key] = url
+
+    def _warm_up(self):
+        """Solve the Cloudflare challenge once so the clearance cookie is set."""
+        try:
+            self.scraper.get('https://www.ibdb.com/', timeout=30)
+        except Exception as exc:
+            print(f"  IBDB warm-up request failed: {exc}")
+
+    def export_cookies(self):
+        """Session cookies (including cf_clearance) for seeding new scrapers."""
+        return self.scraper.cookies.get_dict()
+
+    def _http_get(self, url, **kwargs):
+        """GET through the session, skipping the politeness delay on cache hits.
+
+        With requests-cache installed, a first probe with only_if_cached
+        answers straight from SQLite (504 means not cached); only real
+        network requests go through the rate limiter.
+        """
+        scraper = next(self._rr)
+        if requests_cache is not None:
+            response = scraper.get(url, only_if_cached=True, timeout=30,
+                                   **kwargs)
+            if response.status_code != 504:
+                response.encoding = 'utf-8'
+                return response
+        self.rate_limiter.wait(host=urlparse(url).netloc)
+        response = scraper.get(url, timeout=30, **kwargs)
+        # Every site we hit serves UTF-8; pinning it keeps .text from
+        # falling back to charset detection over the whole body.
+        response.encoding = 'utf-8'
+        return response
+
+    def search_ibdb_directly(self, show_name):
+        """Resolve a show through IBDB's own search, skipping Google entirely.
+
+        Returns the first /broadway-production/ result URL, or None when the
+        search comes up empty.
+        """
+        cache_key = f'url:{_normalize_show_name(show_name)}'
+        cached = self._cached_url(cache_key)
+        if cached is not None:
+            return cached
+
+        search_url = f'https://www.ibdb.com/search?text={quote_plus(show_name)}'
+        try:
+            response = self._http_get(search_url)
+            response.raise_for_status()
+        except Exception as exc:
+            print(f"  IBDB search failed for '{show_name}': {exc}")
+            return None
+
+        match = _IBDB_SEARCH_RESULT_RE.search(response.text)
+        if match is None:
+            return None
+        href = f'https://www.ibdb.com{match.group(1)}'
+        self._store_url(cache_key, href)
+        return href
+
+    def search_duckduckgo_for_ibdb(self, show_name):
+        """Resolve a show through DuckDuckGo's HTML endpoint.
+
+        The endpoint serves plain result links without JavaScript or
+        CAPTCHAs, so the target URL falls out of one regex over the page.
+        """
+        cache_key = f'url:{_normalize_show_name(show_name)}'
+        cached = self._cached_url(cache_key)
+        if cached is not None:
+            return cached
+
+        query = quote_plus(f'{show_name} site:ibdb.com broadway-production')
+        search_url = f'https://html.duckduckgo.com/html/?q={query}'
+        try:
+            response = self._http_get(search_url)
+            response.raise_for_status()
+        except Exception as exc:
+            print(f"  DuckDuckGo search failed for '{show_name}': {exc}")
+            return None
+
+        for match in _DDG_UDDG.finditer(response.text):
+            url = unquote(match.group(1))
+            if 'ibdb.com/broadway-production' in url:
+                self._store_url(cache_key, url)
+                return url
+        return None
+
+    def search_google_for_ibdb(self, show_name):
+        """Search Google for a show's IBDB production page and return its URL."""
+        cache_key = f'url:{_normalize_show_name(show_name)}'
+        cached = self._cached_url(cache_key)
+        if cached is not None:
+            return cached
+
+        query = quote_plus(f'{show_name} IBDB Broadway production')
+        search_url = f'https://www.google.com/search?q={query}'
+
+        try:
+            response = self._http_get(search_url)
+            response.raise_for_status()
+        except Exception as exc:
+            print(f"  Google search failed for '{show_name}': {exc}")
+            return None
+
+        match = (_GOOGLE_RESULT_RE.search(response.text)
+                 or _DIRECT_IBDB_RE.search(response.text))
+        if match is None:
+            return None
+        self._store_url(cache_key, match.group(1))
+        return match.group(1)
+
+    def _walk_page_lxml(self, content):
+        """Streaming fallback walk: bounded memory via lxml's pull parser.
+
+        Feeds the document through HTMLPullParser in chunks and clears each
+        block subtree once it has been processed, so the full DOM is never
+        resident at once. Same extraction as the selectolax path.
+        """
+        from lxml import etree
+
+        if isinstance(content, str):
+            content = content.encode('utf-8', 'replace')
+
+        parser = etree.HTMLPullParser(events=('end',))
+        names = set()
+        text_parts = []
+        chunk_size = 1 << 16
+
+        def drain_events():
+            for _, el in parser.read_events():
+                if el.tag not in ('tr', 'li', 'p', 'div'):
+                    continue
+                # Nested blocks were cleared at their own end event (tails
+                # kept, so text between sibling blocks survives for the
+                # ancestor's walk); each piece of text is collected exactly
+                # once.
+                block_text = ''.join(el.itertext())
+                text_parts.append(block_text)
+                lowered = block_text.lower()
+                if _PRODUCER_WORD.search(lowered) or 'produced by' in lowered:
+                    for link in el.iter('a'):
+                        href = link.get('href') or ''
+                        if _PERSON_HREF.search(href):
+                            clean_name = _PAREN_RE.sub(
+                                '', ''.join(link.itertext())).strip()
+                            if 2 < len(clean_name) < 60:
+                                names.add(clean_name)
+                el.clear(keep_tail=True)
+
+        for offset in range(0, len(content), chunk_size):
+            parser.feed(content[offset:offset + chunk_size])
+            drain_events()
+        # Elements left open at EOF (trailing blocks in real-world HTML)
+        # only get their end events once the parser is closed.
+        parser.close()
+        drain_events()
+
+        return '\n'.join(text_parts), names
+
+    def _walk_page_selectolax(self, html):
+        """Same extraction as _walk_page_bs4 on selectolax's C-level tree."""
+        tree = SelectolaxParser(html)
+        names = set()
+
+        for link in tree.css('a[href*="/person/"], a[href*="/organization/"]'):
+            parent = link.parent
+            while parent is not None and parent.tag not in ('tr', 'li', 'p', 'div'):
+                parent = parent.parent
+            if parent is None:
+                continue
+            context_text = parent.text(deep=True).lower()
+            if _PRODUCER_WORD.search(context_text) or 'produced by' in context_text:
+                clean_name = _PAREN_RE.sub('', link.text(deep=True)).strip()
+                if 2 < len(clean_name) < 60:
+                    names.add(clean_name)
+
+        body = tree.body
+        page_text = body.text(deep=True) if body is not None else ''
+        return page_text, names
+
+    def _fetch_page(self, ibdb_url):
+        """Return the page body for a URL, through the cache when possible.
+
+        Fresh fetches store the body with its ETag/Last-Modified validators.
+        Cached entries are served directly while fresh; stale entries are
+        revalidated with a conditional GET, where a 304 costs a handful of
+        header bytes instead of the ~100KB body.
+        """
+        cache_key = f'html:{ibdb_url}'
+        entry = self.cache.get(cache_key)
+        if entry is not None and not isinstance(entry, dict):
+            # Entry from before validators were stored alongside the body.
+            entry = {'body': entry, 'etag': None, 'last_modified': None,
+                     'fetched_at': 0.0}
+
+        headers = {}
+        if entry is not None:
+            if time.time() - entry.get('fetched_at', 0.0) < REVALIDATE_AFTER:
+                return entry['body']
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self._http_get(ibdb_url, headers=headers)
+            if response.status_code == 304 and entry is not None:
+                entry['fetched_at'] = time.time()
+                self.cache[cache_key] = entry
+                return entry['body']
+            response.raise_for_status()
+        except Exception as exc:
+            print(f"  IBDB fetch failed for {ibdb_url}: {exc}")
+            # A stale body beats no body.
+            return entry['body'] if entry is not None else None
+
+        self.cache[cache_key] = {
+            'body': response.content,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        return response.content
+
+    def parse_producers_from_ibdb_page(self, html, show_name):
+        """Extract producer names from an IBDB production page.
+
+        Accepts the page as str or raw response bytes. A single pass over
+        the document collects the page text (for the "Produced by ..." block
+        regex, which also covers plain-text credit tables) while classifying
+        person/organization links whose block mentions producing. The walk
+        runs on selectolax when available and falls back to a streaming lxml
+        parse otherwise.
+        """
+        # Redirect/error/cast-only pages never mention producing at all;
+        # a raw substring scan is C-level and skips building a tree for them.
+        raw = html if isinstance(html, bytes) else html.encode()
+        if b'roduced by' not in raw and b'roducer' not in raw:
+            return {
+                'producer_names': [],
+                'num_total_producers': 0,
+                'parse_status': 'no_producers_found',
+                'parse_notes': 'no producer marker in page',
+            }
+
+        # Identical bodies parse identically; the hash is a fraction of the
+        # tree walk it skips.
+        body_key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cached = self._parse_cache.get(body_key)
+        if cached is not None:
+            return cached
+
+        if USE_SELECTOLAX and SelectolaxParser is not None:
+            page_text, link_names = self._walk_page_selectolax(html)
+        else:
+            page_text, link_names = self._walk_page_lxml(html)
+
+        producer_names = set(link_names)
+        parse_notes = ['person links'] if link_names else []
+
+        # "Produced by ..." block in the accumulated page text; catches
+        # plain-text producer lists and credit-table rows without links.
+        produced_by_match = _PRODUCED_BY_RE.search(page_text)
+        if produced_by_match:
+            producer_text = produced_by_match.group(1)
+            producer_text = _AND_RE.sub(', ', producer_text)
+            found_any = False
+            for producer in map(str.strip, producer_text.split(',')):
+                clean_name = _PAREN_RE.sub('', producer).strip()
+                if (2 < len(clean_name) < 60
+                        and clean_name.lower() not in _SKIP_TERMS):
+                    producer_names.add(clean_name)
+                    found_any = True
+            if found_any:
+                parse_notes.append('produced-by text block')
+
+        result = {
+            'producer_names': sorted(producer_names),
+            'num_total_producers': len(producer_names),
+            'parse_status': 'ok' if producer_names else 'no_producers_found',
+            'parse_notes': '; '.join(parse_notes),
+        }
+        self._parse_cache[body_key] = result
+        return result
+
+    def get_producers_for_show(self, show_name):
+        """Resolve a show to its IBDB page and return its parsed producer credits."""
+        print(f"Looking up producers for '{show_name}'...")
+        ibdb_url = self.search_ibdb_directly(show_name)
+        if ibdb_url is None:
+            ibdb_url = self.search_duckduckgo_for_ibdb(show_name)
+        if ibdb_url is None:
+            ibdb_url = self.search_google_for_ibdb(show_name)
+        if ibdb_url is None:
+            return {'producer_names': [], 'num_total_producers': 0,
+                    'parse_status': 'no_ibdb_url', 'parse_notes': ''}
+
+        html = self._fetch_page(ibdb_url)
+        if html is None:
+            return {'producer_names': [], 'num_total_producers': 0,
+                    'parse_status': 'fetch_failed', 'parse_notes': ''}
+
+        result = self.parse_producers_from_ibdb_page(html, show_name)
+        result['ibdb_url'] = ibdb_url
+        return result
+
+
+class AsyncAdvancedIBDBScraper:
+    """asyncio front end for sweeping many shows concurrently.
+
+    Wraps a warmed AdvancedIBDBScraper for its Cloudflare cookies and
+    persistent cache, and runs the HTTP traffic through one aiohttp session
+    with bounded concurrency. CPU-bound page parsing is pushed to the
+    default executor so the event loop stays free. Use as an async context
+    manager:
+
+        async with AsyncAdvancedIBDBScraper() as scraper:
+            results = await scraper.get_producers_for_shows(shows)
+    """
+
+    def __init__(self, concurrency=5):
+        if aiohttp is None:
+            raise RuntimeError('aiohttp is required for AsyncAdvancedIBDBScraper')
+        self._sync = AdvancedIBDBScraper()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._session = None
+
+    async def __aenter__(self):
+        user_agent = self._sync.scraper.headers.get('User-Agent', 'Mozilla/5.0')
+        self._session = aiohttp.ClientSession(
+            cookies=self._sync.export_cookies(),
+            headers={'User-Agent': user_agent},
+            timeout=aiohttp.ClientTimeout(total=30))
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+
+    async def _get_text(self, url):
+        async with self._session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    async def search_ibdb_directly(self, show_name):
+        """Async variant of AdvancedIBDBScraper.search_ibdb_directly."""
+        cache_key = f'url:{_normalize_show_name(show_name)}'
+        cached = self._sync.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        search_url = f'https://www.ibdb.com/search?text={quote_plus(show_name)}'
+        try:
+            text = await self._get_text(search_url)
+        except Exception as exc:
+            print(f"  IBDB search failed for '{show_name}': {exc}")
+            return None
+
+        match = _IBDB_SEARCH_RESULT_RE.search(text)
+        if match is None:
+            return None
+        href = f'https://www.ibdb.com{match.group(1)}'
+        self._sync.cache[cache_key] = href
+        return href
+
+    async def search_duckduckgo_for_ibdb(self, show_name):
+        """Async variant of AdvancedIBDBScraper.search_duckduckgo_for_ibdb."""
+        cache_key = f'url:{_normalize_show_name(show_name)}'
+        cached = self._sync.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        query = quote_plus(f'{show_name} site:ibdb.com broadway-production')
+        try:
+            text = await self._get_text(f'https://html.duckduckgo.com/html/?q={query}')
+        except Exception as exc:
+            print(f"  DuckDuckGo search failed for '{show_name}': {exc}")
+            return None
+
+        for match in _DDG_UDDG.finditer(text):
+            url = unquote(match.group(1))
+            if 'ibdb.com/broadway-production' in url:
+                self._sync.cache[cache_key] = url
+                return url
+        return None
+
+    async def get_producers_for_show(self, show_name):
+        """Async variant of AdvancedIBDBScraper.get_producers_for_show."""
+        async with self._semaphore:
+            ibdb_url = await self.search_ibdb_directly(show_name)
+            if ibdb_url is None:
+                ibdb_url = await self.search_duckduckgo_for_ibdb(show_name)
+            if ibdb_url is None:
+                return {'producer_names': [], 'num_total_producers': 0,
+                        'parse_status': 'no_ibdb_url', 'parse_notes': ''}
+
+            html = self._sync.cache.get(f'html:{ibdb_url}')
+            if isinstance(html, dict):
+                html = html['body']
+            if html is None:
+                try:
+                    html = await self._get_text(ibdb_url)
+                except Exception as exc:
+                    print(f"  IBDB fetch failed for '{show_name}': {exc}")
+                    return {'producer_names': [], 'num_total_producers': 0,
+                            'parse_status': 'fetch_failed', 'parse_notes': str(exc)}
+                self._sync.cache[f'html:{ibdb_url}'] = {
+                    'body': html, 'etag': None, 'last_modified': None,
+                    'fetched_at': time.time()}
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, self._sync.parse_producers_from_ibdb_page, html, show_name)
+        result['ibdb_url'] = ibdb_url
+        return result
+
+    async def get_producers_for_shows(self, show_names):
+        """Fetch producer credits for many shows concurrently."""
+        return await asyncio.gather(
+            *[self.get_producers_for_show(name) for name in show_names])
+
+
+def test_specific_shows():
+    """Quick smoke test against a couple of well-known productions."""
+    scraper = AdvancedIBDBScraper()
+    for show in ['Hamilton', 'Hadestown']:
+        result = scraper.get_producers_for_show(show)
+        print(f"{show}: {result['num_total_producers']} producers "
+              f"({result['parse_status']})")
+        for name in result['producer_names']:
+            print(f"  - {name}")
+
+
+if __name__ == '__main__':
+    test_specific_shows()
@@ -0,0 +1,680 @@
+"""
+Turn the analysis results into shareable reports.
+
+Reads the result tables written by producer_tony_analysis.py and produces
+three summary figures plus two Markdown reports: a plain-language one for
+non-technical readers and a technical one with the full statistics.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is optional
+    pl = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# The Markdown boilerplate lives in two module-level skeletons so each
+# report is a single format_map over precomputed values - one allocation,
+# one write - instead of dozens of fragment appends. Variable-length
+# sections (tables, ranked lists) are built separately and injected
+# through their own placeholders.
+_LAYMAN_TEMPLATE = """\
+# Does It Take a Village to Win a Tony?
+
+*What ten years of Broadway producing credits tell us about awards*
+
+## The short answer
+
+We looked at **{n_total} Broadway shows** nominated for Best Musical or \
+Best Play.
+
+- Shows that **won** had an average of **{win_mean:.1f} producers**.
+- Shows that **didn't win** had an average of **{lose_mean:.1f} producers**.
+
+{verdict}
+
+## Year by year
+
+| Year | Nominated | Winners | Winner avg producers | \
+Nominee avg producers | Winners had more? |
+|------|-----------|---------|----------------------|\
+-----------------------|-------------------|
+{year_table}
+## The producers who win the most
+
+{top_producers}
+## Before and after the pandemic
+
+- Before 2021, winning shows averaged **{pre_mean:.1f} producers**.
+- From 2021 on, winning shows averaged **{post_mean:.1f} producers**.
+
+![Executive summary](figures/executive_summary.webp)
+"""
+
+_TECHNICAL_TEMPLATE = """\
+# Producer Count and Tony Outcomes: Technical Report
+
+## Sample
+
+- N = {n_total} ({n_winners} winners, {n_non_winners} non-winners)
+
+## Descriptive statistics
+
+| Group | Mean | SD | Median | Min | Max |
+|-------|------|----|--------|-----|-----|
+{stats_table}
+## Hypothesis tests
+
+- Welch/Student t-test: t = {t_stat:.3f}, p = {t_p:.4f}
+- Mann-Whitney U: U = {u_stat:.1f}, p = {u_p:.4f}
+- Cohen's d = {cohens_d:.3f}
+
+## Producer-count trend
+
+- OLS slope = {slope:.3f} producers/year (R² = {r2:.3f})
+
+## Financial highlights
+
+- Highest-grossing producer (3+ shows): **{top_name}** \
+(${top_gross_m:.0f}M across {top_shows} shows)
+- Mean ticket price across producers: ${mean_ticket:.2f}
+
+## Caveats
+
+- Producer credits conflate lead and co-producers.
+- Grosses coverage is incomplete for older shows.
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _init_plotting():
+    """Import matplotlib on first figure, so Markdown-only runs skip the
+    ~300ms of font-cache and rcParams setup entirely."""
+    import matplotlib
+
+    matplotlib.use('Agg')  # headless; skip GUI backend setup
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _moments(a):
+    """Count, mean, and sample variance of an array in one pass."""
+    n = a.size
+    mean = a.sum() / n
+    var = ((a - mean) ** 2).sum() / (n - 1)
+    return n, mean, var
+
+
+class ReportGenerator:
+    """Builds figures and Markdown reports from the analysis result tables."""
+
+    # Per-dataset file stems and the columns the reports actually touch;
+    # the loader only decodes these instead of parsing whole files.
+    DATASETS = {
+        'main': ('producer_tony_analysis',
+                 ['show_name', 'tony_win', 'num_total_producers',
+                  'num_performances', 'production_year']),
+        'producer_success': ('producer_success',
+                             ['producer_name', 'total_shows', 'tony_wins',
+                              'win_rate']),
+        'financials': ('producer_financials',
+                       ['producer_name', 'total_shows_with_data',
+                        'total_gross', 'avg_gross_per_show',
+                        'avg_ticket_price']),
+        'trends': ('producer_trends',
+                   ['production_year', 'mean_producers', 'std_producers',
+                    'num_shows']),
+        'year_comparison': ('tony_wins_by_year',
+                            ['year', 'total_nominated', 'num_winners',
+                             'win_rate', 'avg_producers_winners',
+                             'avg_producers_nominees',
+                             'producer_differential']),
+    }
+
+    # Explicit numeric dtypes per dataset: parsing skips inference and the
+    # narrow types halve the bytes moved through every later reduction.
+    # Counts that can sit next to missing values stay float.
+    SCHEMAS = {
+        'main': {'tony_win': 'int8', 'num_total_producers': 'float32',
+                 'num_performances': 'float32', 'production_year': 'float32'},
+        'producer_success': {'total_shows': 'int16', 'tony_wins': 'int16',
+                             'win_rate': 'float32'},
+        'financials': {'total_shows_with_data': 'int16',
+                       'total_gross': 'float64',
+                       'avg_gross_per_show': 'float32',
+                       'avg_ticket_price': 'float32'},
+        'trends': {'production_year': 'int16', 'mean_producers': 'float32',
+                   'std_producers': 'float32', 'num_shows': 'int16'},
+        'year_comparison': {'year': 'int16', 'total_nominated': 'int16',
+                            'num_winners': 'int16', 'win_rate': 'float32',
+                            'avg_producers_winners': 'float32',
+                            'avg_producers_nominees': 'float32',
+                            'producer_differential': 'float32'},
+    }
+
+    # Output artifact per builder method, relative to reports_dir; used by
+    # the input-hash cache to decide which builders can be skipped.
+    ARTIFACTS = {
+        'create_executive_summary_visual': 'figures/executive_summary.webp',
+        'create_year_by_year_comparison':
+            'figures/year_by_year_comparison.webp',
+        'create_financial_overview': 'figures/financial_overview.webp',
+        'generate_layman_report': 'tony_producers_report.md',
+        'generate_technical_report': 'technical_report.md',
+    }
+
+    def __init__(self, results_dir='analysis/results', reports_dir='reports'):
+        self.results_dir = Path(results_dir)
+        self.reports_dir = Path(reports_dir)
+        self.figures_dir = self.reports_dir / 'figures'
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.figures_dir.mkdir(parents=True, exist_ok=True)
+        self.data = {}
+        self._outcome_stats_cache = None
+        self._fig = None
+
+    def _figure(self):
+        """The shared chart Figure, cleared between uses.
+
+        Each 16x12 Figure allocation sets up a fresh Agg canvas and
+        renderers; reusing one across the create_* methods keeps that to
+        a single allocation per process.
+        """
+        plt = _init_plotting()
+        if self._fig is None:
+            self._fig = plt.figure(figsize=(16, 12), layout='constrained')
+        else:
+            self._fig.clear()
+        return self._fig
+
+    def __del__(self):
+        if self._fig is not None:
+            _init_plotting().close(self._fig)
+
+    def _outcome_stats(self):
+        """Producer-count summary stats per Tony outcome, computed once.
+
+        One grouped aggregation - a fused Polars lazy query when polars is
+        available, a single pandas groupby otherwise - replaces the five
+        separate mean/std/median/min/max passes per group that each report
+        used to make.
+        """
+        if self._outcome_stats_cache is not None:
+            return self._outcome_stats_cache
+
+        if pl is not None:
+            prods = pl.col('num_total_producers')
+            agg = (pl.scan_csv(self.results_dir / 'producer_tony_analysis.csv')
+                   .drop_nulls(['tony_win', 'num_total_producers'])
+                   .group_by('tony_win')
+                   .agg([prods.mean().alias('mean'), prods.std().alias('std'),
+                         prods.median().alias('median'),
+                         prods.min().alias('min'), prods.max().alias('max'),
+                         pl.len().alias('count')])
+                   .collect(streaming=True))
+            self._outcome_stats_cache = {int(row['tony_win']): row
+                                         for row in agg.to_dicts()}
+        else:
+            df_valid = self._load('main').dropna(
+                subset=['tony_win', 'num_total_producers'])
+            agg = df_valid.groupby('tony_win')['num_total_producers'].agg(
+                ['mean', 'std', 'median', 'min', 'max', 'count'])
+            by_outcome = {}
+            for outcome, row in agg.iterrows():
+                # iterrows upcasts the mixed row to float64; restore the
+                # count to int so both paths (and the reports) agree.
+                summary = row.to_dict()
+                summary['count'] = int(summary['count'])
+                by_outcome[int(outcome)] = summary
+            self._outcome_stats_cache = by_outcome
+        return self._outcome_stats_cache
+
+    def _load(self, name):
+        """Load one result table, projecting just the columns we use.
+
+        Prefers a Parquet sibling when one exists (columnar reads decode
+        only the requested columns, in parallel Arrow threads) and falls
+        back to the CSV through the pyarrow engine. Frames are cached so
+        the report writers don't reparse.
+        """
+        if name in self.data:
+            return self.data[name]
+
+        stem, columns = self.DATASETS[name]
+        parquet_path = self.results_dir / f'{stem}.parquet'
+        if pq is not None and parquet_path.exists():
+            table = pq.read_table(parquet_path, columns=columns)
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            # Upstream writes 64-bit types; land in the same narrow schema
+            # as the CSV path so reductions move half the bytes.
+            df = df.astype(self.SCHEMAS[name])
+        else:
+            df = pd.read_csv(self.results_dir / f'{stem}.csv',
+                             usecols=columns, dtype=self.SCHEMAS[name],
+                             engine='pyarrow', dtype_backend='pyarrow')
+        self.data[name] = df
+        return df
+
+    def _filtered_3plus(self, name, count_col):
+        """Producers with at least three shows, filtered once and cached."""
+        key = f'{name}_3plus'
+        if key not in self.data:
+            df = self._load(name)
+            self.data[key] = df[df[count_col] >= 3].reset_index(drop=True)
+        return self.data[key]
+
+    def load_all_data(self):
+        """Load every result table into the cache."""
+        for name in self.DATASETS:
+            self._load(name)
+        logger.info("Loaded %d result tables", len(self.data))
+        return self.data
+
+    def create_executive_summary_visual(self):
+        """2x2 overview: the headline numbers on one page."""
+        df_trends = self._load('trends')
+
+        from matplotlib.ticker import FixedFormatter, FixedLocator
+
+        fig = self._figure()
+        axes = fig.subplots(2, 2)
+
+        # Producer counts, winners vs non-winners.
+        ax = axes[0, 0]
+        outcome_stats = self._outcome_stats()
+        means = [outcome_stats[1]['mean'], outcome_stats[0]['mean']]
+        bars = ax.bar(['Tony winners', 'Non-winners'], means,
+                      color=['#f1c40f', '#95a5a6'])
+        ax.bar_label(bars, labels=[f'{v:.1f}' for v in means], padding=3,
+                     fontweight='bold')
+        ax.set_ylabel('Avg number of producers')
+        ax.set_title('Do winning shows have more producers?')
+
+        # Top producers by wins.
+        ax = axes[0, 1]
+        df_filtered = self._filtered_3plus('producer_success',
+                                           'total_shows')
+        top_wins = df_filtered.nlargest(10, 'tony_wins').iloc[::-1]
+        y_pos = np.arange(len(top_wins))
+        bars = ax.barh(y_pos, top_wins['tony_wins'], color='#2ecc71')
+        ax.yaxis.set_major_locator(FixedLocator(y_pos))
+        ax.yaxis.set_major_formatter(
+            FixedFormatter(top_wins['producer_name'].tolist()))
+        ax.tick_params(axis='y', labelsize=9)
+        ax.bar_label(bars, labels=[f'{int(v)}' for v in top_wins['tony_wins']],
+                     padding=3, fontweight='bold')
+        ax.set_xlabel('Tony wins')
+        ax.set_title('Most Tony wins (3+ shows)')
+
+        # Top producers by win rate.
+        ax = axes[1, 0]
+        top_rate = df_filtered.nlargest(10, 'win_rate').iloc[::-1]
+        y_pos = np.arange(len(top_rate))
+        bars = ax.barh(y_pos, top_rate['win_rate'] * 100, color='#3498db')
+        ax.yaxis.set_major_locator(FixedLocator(y_pos))
+        ax.yaxis.set_major_formatter(
+            FixedFormatter(top_rate['producer_name'].tolist()))
+        ax.tick_params(axis='y', labelsize=9)
+        ax.bar_label(bars,
+                     labels=[f'{v:.0f}%' for v in top_rate['win_rate'] * 100],
+                     padding=3, fontweight='bold')
+        ax.set_xlabel('Win rate (%)')
+        ax.set_title('Best win rates (3+ shows)')
+
+        # Producer-count trend over time.
+        ax = axes[1, 1]
+        ax.plot(df_trends['production_year'], df_trends['mean_producers'],
+                marker='o', color='#9b59b6')
+        ax.fill_between(df_trends['production_year'],
+                        df_trends['mean_producers']
+                        - df_trends['std_producers'],
+                        df_trends['mean_producers']
+                        + df_trends['std_producers'],
+                        alpha=0.2, color='#9b59b6')
+        ax.set_xlabel('Production year')
+        ax.set_ylabel('Avg producers per show')
+        ax.set_title('Producer counts over time')
+
+        fig.savefig(self.figures_dir / 'executive_summary.webp', dpi=150,
+                    pil_kwargs={'quality': 90, 'method': 4})
+
+    def create_year_by_year_comparison(self):
+        """Winner vs nominee producer counts, season by season."""
+        df_year = self._load('year_comparison')
+
+        fig = self._figure()
+        axes = fig.subplots(2, 1)
+
+        # Grouped bars: winner vs nominee averages per year.
+        ax = axes[0]
+        x = np.arange(len(df_year))
+        width = 0.38
+        bars_w = ax.bar(x - width / 2, df_year['avg_producers_winners'],
+                        width, label='Winners', color='#f1c40f')
+        bars_n = ax.bar(x + width / 2, df_year['avg_producers_nominees'],
+                        width, label='Nominees', color='#95a5a6')
+        ax.bar_label(bars_w, fmt='%.1f', padding=2, fontsize=8)
+        ax.bar_label(bars_n, fmt='%.1f', padding=2, fontsize=8)
+        ax.set_xticks(x)
+        ax.set_xticklabels(df_year['year'], rotation=45)
+        ax.set_ylabel('Avg number of producers')
+        ax.set_title('Producer counts: winners vs nominees by year')
+        ax.legend()
+
+        # Signed differential area chart.
+        ax = axes[1]
+        years = df_year['year'].to_numpy()
+        diff = df_year['producer_differential'].to_numpy()
+        pos = diff > 0
+        ax.fill_between(years, 0, diff, where=pos,
+                        color='#2ecc71', alpha=0.6,
+                        label='Winners had more producers')
+        ax.fill_between(years, 0, diff, where=~pos,
+                        color='#e74c3c', alpha=0.6,
+                        label='Nominees had more producers')
+        ax.axhline(0, color='black', linewidth=0.8)
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Winner - nominee avg producers')
+        ax.set_title('Producer differential by year')
+        ax.legend()
+
+        fig.savefig(self.figures_dir / 'year_by_year_comparison.webp',
+                    dpi=150, pil_kwargs={'quality': 90, 'method': 4})
+
+    def create_financial_overview(self):
+        """2x2 financial picture from the grosses-backed producer table."""
+        df_fin = self._load('financials')
+        df_filtered = self._filtered_3plus('financials',
+                                           'total_shows_with_data')
+
+        from matplotlib.ticker import FixedFormatter, FixedLocator
+
+        fig = self._figure()
+        axes = fig.subplots(2, 2)
+
+        # Top producers by total gross.
+        ax = axes[0, 0]
+        top_gross = df_filtered.nlargest(10, 'total_gross').iloc[::-1]
+        y_pos = np.arange(len(top_gross))
+        bars = ax.barh(y_pos, top_gross['total_gross'] / 1e6,
+                       color='#27ae60')
+        ax.yaxis.set_major_locator(FixedLocator(y_pos))
+        ax.yaxis.set_major_formatter(
+            FixedFormatter(top_gross['producer_name'].tolist()))
+        ax.tick_params(axis='y', labelsize=9)
+        ax.bar_label(bars,
+                     labels=[f'${v:.0f}M'
+                             for v in top_gross['total_gross'] / 1e6],
+                     padding=3, fontweight='bold')
+        ax.set_xlabel('Total gross ($M)')
+        ax.set_title('Top producers by total gross (3+ shows)')
+
+        # Top producers by per-show average.
+        ax = axes[0, 1]
+        top_avg = df_filtered.nlargest(10, 'avg_gross_per_show').iloc[::-1]
+        y_pos = np.arange(len(top_avg))
+        bars = ax.barh(y_pos, top_avg['avg_gross_per_show'] / 1e6,
+                       color='#2980b9')
+        ax.yaxis.set_major_locator(FixedLocator(y_pos))
+        ax.yaxis.set_major_formatter(
+            FixedFormatter(top_avg['producer_name'].tolist()))
+        ax.tick_params(axis='y', labelsize=9)
+        ax.bar_label(bars,
+                     labels=[f'${v:.0f}M'
+                             for v in top_avg['avg_gross_per_show'] / 1e6],
+                     padding=3, fontweight='bold')
+        ax.set_xlabel('Avg gross per show ($M)')
+        ax.set_title('Top producers by per-show gross (3+ shows)')
+
+        # Ticket price distribution.
+        ax = axes[1, 0]
+        atp_data = df_fin['avg_ticket_price'].dropna()
+        counts, edges = np.histogram(atp_data.to_numpy(), bins=30)
+        ax.stairs(counts, edges, fill=True, color='#3498db', alpha=0.7,
+                  edgecolor='black')
+        ax.set_xlabel('Avg ticket price ($)')
+        ax.set_ylabel('Producers')
+        ax.set_title('Average ticket price distribution')
+
+        # Total gross distribution.
+        ax = axes[1, 1]
+        gross_data = df_fin['total_gross'].dropna() / 1e6
+        counts, edges = np.histogram(gross_data.to_numpy(), bins=30)
+        ax.stairs(counts, edges, fill=True, color='#e67e22', alpha=0.7,
+                  edgecolor='black')
+        ax.set_xlabel('Total gross ($M)')
+        ax.set_ylabel('Producers')
+        ax.set_title('Total gross distribution')
+
+        fig.savefig(self.figures_dir / 'financial_overview.webp', dpi=150,
+                    pil_kwargs={'quality': 90, 'method': 4})
+
+    def generate_layman_report(self):
+        """Plain-language Markdown report."""
+        df = self.data['main']
+        df_year = self._load('year_comparison')
+
+        df_valid = df.dropna(subset=['tony_win', 'num_total_producers'])
+        # Extract the columns once; later sections slice these arrays
+        # instead of re-filtering the frame per section.
+        valid_win = df_valid['tony_win'].to_numpy(dtype=float)
+        valid_prods = df_valid['num_total_producers'].to_numpy(dtype=float)
+        valid_year = df_valid['production_year'].to_numpy(dtype=float)
+        outcome_stats = self._outcome_stats()
+        win_stats = outcome_stats[1]
+        lose_stats = outcome_stats[0]
+
+        year_rows = df_year[['year', 'total_nominated', 'num_winners',
+                             'avg_producers_winners',
+                             'avg_producers_nominees',
+                             'producer_differential']].to_numpy()
+        year_table = ''.join(
+            f"| {int(r[0])} | {int(r[1])} | {int(r[2])} "
+            f"| {r[3]:.1f} | {r[4]:.1f} "
+            f"| {'✓' if r[5] > 0 else '✗'} |\n"
+            for r in year_rows)
+
+        df_prod_filtered = self._filtered_3plus('producer_success',
+                                                'total_shows')
+        top5 = df_prod_filtered.nlargest(5, 'win_rate')[
+            ['producer_name', 'tony_wins', 'total_shows',
+             'win_rate']].to_numpy()
+        top_producers = ''.join(
+            f"{rank}. **{name}** - {int(wins)} wins out of "
+            f"{int(shows)} shows (**{rate * 100:.0f}% success rate**)\n"
+            for rank, (name, wins, shows, rate) in enumerate(top5, 1))
+
+        win_mask = valid_win == 1
+        pre_winners = valid_prods[(valid_year < 2021) & win_mask]
+        post_winners = valid_prods[(valid_year >= 2021) & win_mask]
+
+        if win_stats['mean'] > lose_stats['mean']:
+            verdict = ("So yes - winning shows do tend to have more names "
+                       "above the title.")
+        else:
+            verdict = ("Surprisingly, winning shows don't carry more "
+                       "producers than the rest.")
+
+        report = _LAYMAN_TEMPLATE.format_map({
+            'n_total': win_stats['count'] + lose_stats['count'],
+            'win_mean': win_stats['mean'],
+            'lose_mean': lose_stats['mean'],
+            'verdict': verdict,
+            'year_table': year_table,
+            'top_producers': top_producers,
+            'pre_mean': pre_winners.mean(),
+            'post_mean': post_winners.mean(),
+        })
+
+        report_path = self.reports_dir / 'tony_producers_report.md'
+        # One buffered write, no universal-newline translation layer.
+        with open(report_path, 'w', buffering=1 << 20, newline='\n',
+                  encoding='utf-8') as f:
+            f.write(report)
+        logger.info("Wrote %s", report_path)
+
+    def generate_technical_report(self):
+        """Full-statistics Markdown report."""
+        df = self.data['main']
+        df_fin = self.data['financials']
+        df_trends = self.data['trends']
+
+        df_valid = df.dropna(subset=['tony_win', 'num_total_producers'])
+        # Slice the producer counts into plain arrays once; the test
+        # section reuses them without building intermediate frames.
+        win = df_valid['tony_win'].to_numpy(dtype=float)
+        prods = df_valid['num_total_producers'].to_numpy(dtype=float)
+        winners = prods[win == 1]
+        non_winners = prods[win == 0]
+
+        outcome_stats = self._outcome_stats()
+        stats_table = ''.join(
+            f"| {label} | {group['mean']:.2f} "
+            f"| {group['std']:.2f} | {group['median']:.1f} "
+            f"| {group['min']:.0f} | {group['max']:.0f} |\n"
+            for label, group in (('Winners', outcome_stats[1]),
+                                 ('Non-winners', outcome_stats[0])))
+
+        # One set of moments per group; t, p, and Cohen's d all derive
+        # from these instead of ttest_ind and the d formula each
+        # re-scanning both arrays.
+        n1, mean1, var1 = _moments(winners)
+        n2, mean2, var2 = _moments(non_winners)
+        pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+        t_stat = (mean1 - mean2) / np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        t_p = 2 * stats.t.sf(abs(t_stat), n1 + n2 - 2)
+        u_stat, u_p = stats.mannwhitneyu(winners, non_winners,
+                                         alternative='two-sided')
+        cohens_d = (mean1 - mean2) / np.sqrt(pooled_var)
+
+        x = df_trends['production_year'].to_numpy(dtype=np.float64)
+        y = df_trends['mean_producers'].to_numpy(dtype=np.float64)
+        slope, intercept = np.polyfit(x, y, 1)
+        r2 = np.corrcoef(x, y)[0, 1] ** 2
+
+        df_fin_filtered = self._filtered_3plus('financials',
+                                               'total_shows_with_data')
+        top_grosser = df_fin_filtered.loc[
+            df_fin_filtered['total_gross'].idxmax()]
+
+        report = _TECHNICAL_TEMPLATE.format_map({
+            'n_total': len(df_valid),
+            'n_winners': outcome_stats[1]['count'],
+            'n_non_winners': outcome_stats[0]['count'],
+            'stats_table': stats_table,
+            't_stat': t_stat, 't_p': t_p,
+            'u_stat': u_stat, 'u_p': u_p,
+            'cohens_d': cohens_d,
+            'slope': slope, 'r2': r2,
+            'top_name': top_grosser['producer_name'],
+            'top_gross_m': top_grosser['total_gross'] / 1e6,
+            'top_shows': int(top_grosser['total_shows_with_data']),
+            'mean_ticket': df_fin['avg_ticket_price'].mean(),
+        })
+
+        report_path = self.reports_dir / 'technical_report.md'
+        with open(report_path, 'w', buffering=1 << 20, newline='\n',
+                  encoding='utf-8') as f:
+            f.write(report)
+        logger.info("Wrote %s", report_path)
+
+    def _input_key(self):
+        """Fingerprint of every input table: path, mtime_ns, and size.
+
+        Cheap stat calls stand in for hashing file contents; a rewrite
+        with identical bytes regenerates, which is the safe direction.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for stem, _ in self.DATASETS.values():
+            for suffix in ('.parquet', '.csv'):
+                path = self.results_dir / f'{stem}{suffix}'
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                h.update(f'{path}:{st.st_mtime_ns}:{st.st_size}'.encode())
+        return h.hexdigest()
+
+    def generate_all_reports(self):
+        """Build figures and reports whose inputs changed since last run.
+
+        A .cache.json sidecar in reports_dir records the input fingerprint
+        each artifact was last built from; builders whose fingerprint
+        matches and whose output still exists are skipped entirely.
+        """
+        cache_path = self.reports_dir / '.cache.json'
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+        key = self._input_key()
+
+        def stale(method):
+            return (cache.get(method) != key
+                    or not (self.reports_dir / self.ARTIFACTS[method]).exists())
+
+        # Figure rendering is CPU-bound (Agg draw + image encode) and the
+        # three figures are independent, so stale ones run in worker
+        # processes; each worker loads just the columns its figure touches.
+        figure_methods = [m for m in ('create_executive_summary_visual',
+                                      'create_year_by_year_comparison',
+                                      'create_financial_overview')
+                          if stale(m)]
+        if figure_methods:
+            render = partial(_render_figure, results_dir=self.results_dir,
+                             reports_dir=self.reports_dir)
+            with ProcessPoolExecutor(max_workers=3) as pool:
+                list(pool.map(render, figure_methods))
+
+        report_methods = [m for m in ('generate_layman_report',
+                                      'generate_technical_report')
+                          if stale(m)]
+        if report_methods:
+            self.load_all_data()
+            for method in report_methods:
+                getattr(self, method)()
+
+        for method in figure_methods + report_methods:
+            cache[method] = key
+        cache_path.write_text(json.dumps(cache, indent=2))
+        logger.info("All reports up to date in %s (%d rebuilt)",
+                    self.reports_dir,
+                    len(figure_methods) + len(report_methods))
+
+
+def _render_figure(method_name, results_dir, reports_dir):
+    """Build one figure in a worker process.
+
+    Top-level so it pickles; the worker constructs its own generator and
+    loads data through the column-projecting loader.
+    """
+    generator = ReportGenerator(results_dir=results_dir,
+                                reports_dir=reports_dir)
+    getattr(generator, method_name)()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    ReportGenerator().generate_all_reports()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,562 @@
+"""
+Does hiring more producers buy a show a Tony?
+
+Merges the scraped producer credits with Tony nomination outcomes (and,
+when the weekly grosses workbook is present, Broadway grosses), then runs
+descriptive statistics, significance tests, and a logistic regression of
+winning on producer count, plus per-producer success and financial
+breakdowns. Results land in analysis/results and analysis/figures.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use('Agg')  # headless; skip GUI backend setup
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+import statsmodels.api as sm
+from scipy import stats
+
+sns.set_style('whitegrid')  # once at import; re-applying rebuilds rc state
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path('data')
+RESULTS_DIR = Path('analysis/results')
+FIGURES_DIR = Path('analysis/figures')
+
+PRODUCER_FILE = DATA_DIR / 'tony_shows_with_producers.csv'
+TONY_FILE = DATA_DIR / 'tony_nominations.csv'
+GROSSES_FILE = DATA_DIR / 'broadway_grosses.xlsx'
+CACHE_DIR = DATA_DIR / '.cache'
+
+
+# Only these columns ever leave load_and_merge_data; usecols keeps the
+# parser from tokenizing and allocating the rest of each file. The Tony
+# set is a callable because opening_month is optional in that export.
+_PRODUCER_USECOLS = ['show_name', 'num_total_producers', 'producer_names',
+                     'num_performances', 'production_year']
+_TONY_USECOLS = {'show_name', 'tony_win', 'tony_category', 'tony_year',
+                 'opening_month'}
+
+
+def _source_key():
+    """Fingerprint of the source files: path, mtime_ns, and size."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in (PRODUCER_FILE, TONY_FILE, GROSSES_FILE):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        h.update(f'{path}:{st.st_mtime_ns}:{st.st_size}'.encode())
+    return h.hexdigest()
+
+
+def load_and_merge_data():
+    """Load producer credits, Tony outcomes, and (optionally) grosses.
+
+    The merged frame (and the grosses workbook, whose xlsx parse is by
+    far the slowest load here) is memoized to parquet keyed by the
+    sources' mtimes, so repeat runs during development skip the parsing
+    and the join entirely.
+    """
+    key = _source_key()
+    merged_cache = CACHE_DIR / f'merged_{key}.parquet'
+    grosses_cache = CACHE_DIR / f'grosses_{key}.parquet'
+    if merged_cache.exists():
+        df = pd.read_parquet(merged_cache)
+        grosses_df = (pd.read_parquet(grosses_cache)
+                      if grosses_cache.exists() else None)
+        logger.info("Merged dataset from cache: %d shows", len(df))
+        return df, grosses_df
+
+    producer_df = pd.read_csv(PRODUCER_FILE, usecols=_PRODUCER_USECOLS,
+                              dtype={'num_total_producers': 'Int32'})
+    tony_df = pd.read_csv(TONY_FILE, usecols=_TONY_USECOLS.__contains__,
+                          dtype={'tony_win': 'Int8'})
+
+    # Join on categorical codes rather than raw object strings: both
+    # sides share one dtype (hence the union), so key lookups compare
+    # small integers instead of hashing Python str objects.
+    show_dtype = pd.api.types.union_categoricals(
+        [tony_df['show_name'].astype('category'),
+         producer_df['show_name'].astype('category')]).dtype
+    tony_df['show_name'] = tony_df['show_name'].astype(show_dtype)
+    producer_df['show_name'] = producer_df['show_name'].astype(show_dtype)
+
+    # Each title appears once in the producer export, so mapping each
+    # column through an indexed lookup does the left join without
+    # merge's hash-join build, suffix handling, and frame copy; a
+    # categorical key is mapped once per unique title, not per row.
+    lookup = producer_df.drop_duplicates('show_name').set_index('show_name')
+    df = tony_df
+    for col in lookup.columns:
+        df[col] = df['show_name'].map(lookup[col])
+
+    grosses_df = None
+    if GROSSES_FILE.exists():
+        grosses_df = pd.read_excel(GROSSES_FILE)
+        logger.info("Loaded %d weekly gross rows", len(grosses_df))
+
+    logger.info("Merged dataset: %d shows", len(df))
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        df.to_parquet(merged_cache, index=False)
+        if grosses_df is not None:
+            grosses_df.to_parquet(grosses_cache, index=False)
+    except ImportError:
+        logger.info("No parquet engine installed; skipping load cache")
+    return df, grosses_df
+
+
+def clean_data(df):
+    """Coerce numeric columns and drop shows without the core fields."""
+    # read_csv's dtype map already types the counter columns, making these
+    # coercions full-column no-op scans; only run them when a column
+    # actually arrived as object (stray text in the export).
+    for col in ('num_total_producers', 'num_performances',
+                'production_year', 'tony_win'):
+        if df[col].dtype == object:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    # Boolean .loc already yields a new frame, so no extra .copy() pass
+    # over every column; assign replaces the win flag on a shallow copy
+    # (int8 keeps it narrow downstream) without the chained-assignment
+    # warning a direct column write on the slice would raise.
+    mask = df['num_total_producers'].notna() & df['tony_win'].notna()
+    df_clean = df.loc[mask].assign(
+        tony_win=lambda d: d['tony_win'].astype('int8'))
+    logger.info("After cleaning: %d shows", len(df_clean))
+    return df_clean
+
+
+def _group_summary(vals):
+    """Mean, median, and sample std of a 1-D float array.
+
+    The median comes from np.partition - an O(n) partial select around the
+    middle order statistics - rather than the full sort np.median performs;
+    mean and std share the single deviations buffer.
+    """
+    n = vals.size
+    mean = vals.mean()
+    std = np.sqrt(np.square(vals - mean).sum() / (n - 1))
+    k = n // 2
+    if n % 2:
+        median = np.partition(vals, k)[k]
+    else:
+        part = np.partition(vals, (k - 1, k))
+        median = (part[k - 1] + part[k]) / 2
+    return mean, median, std
+
+
+def descriptive_stats(winners, non_winners):
+    """Summarize producer counts for winners vs non-winners.
+
+    Takes the two pre-split NumPy arrays built once in main.
+    """
+    total = len(winners) + len(non_winners)
+    logger.info("=== Descriptive statistics ===")
+    logger.info("Shows: %d total, %d winners, %d non-winners",
+                total, len(winners), len(non_winners))
+    logger.info("Win rate: %.1f%%", len(winners) / total * 100)
+    logger.info("Winners:     mean %.2f, median %.1f, std %.2f",
+                *_group_summary(winners))
+    logger.info("Non-winners: mean %.2f, median %.1f, std %.2f",
+                *_group_summary(non_winners))
+
+
+def statistical_tests(winners, non_winners):
+    """t-test, Mann-Whitney U, and Cohen's d for the producer-count gap."""
+    t_stat, t_p = stats.ttest_ind(winners, non_winners)
+    u_stat, u_p = stats.mannwhitneyu(winners, non_winners,
+                                     alternative='two-sided')
+
+    pooled_var = (((len(winners) - 1) * winners.var(ddof=1)
+                   + (len(non_winners) - 1) * non_winners.var(ddof=1))
+                  / (len(winners) + len(non_winners) - 2))
+    cohens_d = (winners.mean() - non_winners.mean()) / np.sqrt(pooled_var)
+
+    logger.info("=== Statistical tests ===")
+    logger.info("t-test:        t=%.3f, p=%.4f", t_stat, t_p)
+    logger.info("Mann-Whitney:  U=%.1f, p=%.4f", u_stat, u_p)
+    logger.info("Cohen's d:     %.3f", cohens_d)
+    return {'t_stat': t_stat, 't_p': t_p, 'u_stat': u_stat, 'u_p': u_p,
+            'cohens_d': cohens_d}
+
+
+def logistic_regression(x, y):
+    """Logit of tony_win (y) on num_total_producers (x).
+
+    clean_data already dropped rows missing either field, so the arrays
+    arrive dense.
+    """
+    # Build the design matrix directly: same model as the
+    # 'tony_win ~ num_total_producers' formula without the Patsy parse or
+    # the frame re-copy it does internally. Column 0 is the constant.
+    X = sm.add_constant(x[:, np.newaxis])
+    result = sm.Logit(y, X).fit(disp=False, method='newton')
+
+    logger.info("=== Logistic regression ===")
+    logger.info("coef(num_total_producers) = %.4f (p=%.4f)",
+                result.params[1], result.pvalues[1])
+    logger.info("pseudo R-squared = %.4f", result.prsquared)
+    return result.params[0], result.params[1]
+
+
+def create_visualizations(x, win_mask, b0, b1):
+    """Box plot and jittered win-probability scatter with a logistic curve.
+
+    x and win_mask are the arrays split once in main; b0/b1 are the
+    intercept and slope from logistic_regression, so the curve is evaluated
+    directly rather than refitting a second model.
+    """
+    FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+
+    # One cached Figure per process, cleared between calls: Figure
+    # construction allocates a large object graph that doesn't need to be
+    # rebuilt (and garbage-collected) on every invocation.
+    fig = getattr(create_visualizations, '_fig', None)
+    if fig is None:
+        fig = create_visualizations._fig = plt.figure(figsize=(14, 6))
+    fig.clf()
+    axes = fig.subplots(1, 2)
+
+    # ax.boxplot on the pre-split arrays does what sns.boxplot did minus
+    # the frame copy and the groupby seaborn runs under the hood.
+    axes[0].boxplot([x[~win_mask], x[win_mask]], labels=['No', 'Yes'])
+    axes[0].set_xlabel('Tony Winner')
+    axes[0].set_ylabel('num_total_producers')
+    axes[0].set_title('Producer count by Tony outcome')
+
+    # PCG64 generator, float32 samples, in-place add: no legacy global-RNG
+    # lock, half the memory traffic, and no Series temporary. Seeded so the
+    # jitter is reproducible across runs.
+    rng = np.random.default_rng(0)
+    jitter = np.float32(0.05)
+    y = win_mask.astype(np.float32)
+    y += rng.standard_normal(y.shape, dtype=np.float32) * jitter
+    colors = np.where(win_mask, 'red', 'blue')
+    axes[1].scatter(x, y, c=colors, alpha=0.4, s=20, rasterized=True)
+
+    x_range = np.linspace(x.min(), x.max(), 100)
+    y_prob = 1.0 / (1.0 + np.exp(-(b0 + b1 * x_range)))
+    axes[1].plot(x_range, y_prob, color='black', linewidth=2)
+    axes[1].set_title('Win probability vs producer count')
+    axes[1].set_xlabel('Number of producers')
+    axes[1].set_ylabel('Tony win')
+
+    fig.tight_layout()
+    # 120 dpi reads fine in a report; 300 encoded >6x the pixels.
+    fig.savefig(FIGURES_DIR / 'producer_count_vs_tony_win.png', dpi=120,
+                bbox_inches='tight')
+
+
+def tony_season_years(production_year, opening_month):
+    """Tony season each production competes in, computed column-wise.
+
+    Shows opening May or later are judged at the following year's awards.
+    Rows missing either field keep their production year unchanged.
+    """
+    shift = (opening_month.fillna(0) >= 5).astype('int8')
+    out = production_year + shift
+    missing = opening_month.isna() | production_year.isna()
+    out[missing] = production_year[missing]
+    return out
+
+
+def get_tony_season_year(production_year, opening_month):
+    """Scalar convenience wrapper around tony_season_years."""
+    return tony_season_years(pd.Series([production_year]),
+                             pd.Series([opening_month])).iloc[0]
+
+
+def analyze_tony_wins_by_year(df):
+    """Per-season nomination/win counts and the winner-nominee producer gap.
+
+    Shows are grouped by the Tony season they competed in (a late opening
+    puts a show at the following year's awards), so the table compares
+    shows that were actually up against each other.
+    """
+    df_tony = df.dropna(subset=['production_year']).copy()
+    opening_month = df_tony.get(
+        'opening_month', pd.Series(np.nan, index=df_tony.index))
+    df_tony['tony_season'] = tony_season_years(df_tony['production_year'],
+                                               opening_month)
+
+    year_df = df_tony.groupby('tony_season').agg(
+        total_nominated=('tony_win', 'size'),
+        num_winners=('tony_win', 'sum'),
+        avg_producers_all=('num_total_producers', 'mean'),
+    )
+    win_mask = df_tony['tony_win'] == 1
+    year_df['avg_producers_winners'] = df_tony[win_mask].groupby(
+        'tony_season')['num_total_producers'].mean()
+    year_df['avg_producers_nominees'] = df_tony[~win_mask].groupby(
+        'tony_season')['num_total_producers'].mean()
+
+    year_df['win_rate'] = year_df['num_winners'] / year_df['total_nominated']
+    year_df['producer_differential'] = (year_df['avg_producers_winners']
+                                        - year_df['avg_producers_nominees'])
+    year_df = year_df.reset_index().rename(
+        columns={'tony_season': 'year'})
+    year_df['year'] = year_df['year'].astype(int)
+    year_df.to_csv(RESULTS_DIR / 'tony_wins_by_year.csv', index=False)
+    return year_df
+
+
+def analyze_producer_trends(df):
+    """Producer-count mean/std per production year."""
+    df_trend = df.dropna(subset=['production_year'])
+    rows = []
+    for year in sorted(df_trend['production_year'].unique()):
+        counts = df_trend[df_trend['production_year'] == year][
+            'num_total_producers']
+        rows.append({
+            'production_year': int(year),
+            'mean_producers': counts.mean(),
+            'std_producers': counts.std(),
+            'num_shows': len(counts),
+        })
+    trends_df = pd.DataFrame(rows)
+    trends_df.to_csv(RESULTS_DIR / 'producer_trends.csv', index=False)
+    return trends_df
+
+
+def analyze_individual_producers(df):
+    """Win/show tallies per producer, across all their credited shows."""
+    # Long-form (show, producer) frame via explode, then one grouped
+    # aggregation - the same shape as the bubble-chart path - instead of
+    # an iterrows loop feeding a dict of Python lists.
+    split = df['producer_names'].dropna().str.split(r'\s*;\s*', regex=True)
+    long = df.loc[split.index, ['show_name', 'tony_win',
+                                'num_performances']].assign(producer=split)
+    long = long.explode('producer')
+    long = long[long['producer'].astype(bool)]
+
+    producer_df = long.groupby('producer', sort=False).agg(
+        total_shows=('tony_win', 'size'),
+        tony_wins=('tony_win', 'sum'),
+        avg_performances=('num_performances', 'mean'),
+        shows=('show_name', '; '.join),
+    ).reset_index().rename(columns={'producer': 'producer_name'})
+    producer_df['win_rate'] = (producer_df['tony_wins']
+                               / producer_df['total_shows'])
+    producer_df = producer_df[
+        ['producer_name', 'total_shows', 'tony_wins', 'win_rate',
+         'avg_performances', 'shows']].sort_values(
+        ['tony_wins', 'win_rate'], ascending=False)
+    producer_df.to_csv(RESULTS_DIR / 'producer_success.csv', index=False)
+
+    producer_df_filtered = producer_df[producer_df['total_shows'] >= 3]
+    logger.info("=== Top producers (3+ shows) ===")
+    # itertuples hands back plain tuples; iterrows built a Series per row.
+    for row in producer_df_filtered.head(20).itertuples(index=False):
+        logger.info("%-50s | %d/%d wins (%.1f%%)", row.producer_name,
+                    row.tony_wins, row.total_shows, row.win_rate * 100)
+    return producer_df
+
+
+def _normalize_show_key(s):
+    """Uppercased, stripped show names for joining across datasets."""
+    return s.str.upper().str.strip()
+
+
+def add_show_financial_metrics(df, grosses_df):
+    """Attach per-show gross aggregates from the weekly grosses workbook."""
+    # Computed at most once per frame: repeat calls (and the caller's own
+    # frame) reuse the cached key column instead of re-normalizing.
+    if 'Show_upper' not in grosses_df.columns:
+        grosses_df['Show_upper'] = _normalize_show_key(grosses_df['Show'])
+    show_grosses = grosses_df.groupby('Show_upper').agg(
+        Total_Gross=('Gross', 'sum'),
+        Avg_Weekly_Gross=('Gross', 'mean'),
+        Avg_Ticket_Price=('Avg_Ticket', 'mean'),
+        Total_Attendance=('Attendance', 'sum'),
+        Num_Weeks=('Week', 'size'),
+    )
+
+    # The grouped index is unique per title, so mapping each aggregate
+    # through the normalized key replaces merge's hash-join build and
+    # its suffixed copy of the frame.
+    df_with_grosses = df.copy()
+    key = _normalize_show_key(df_with_grosses['show_name'])
+    for col in show_grosses.columns:
+        df_with_grosses[col] = key.map(show_grosses[col])
+    logger.info("Shows with financial data: %d",
+                df_with_grosses['Total_Gross'].notna().sum())
+    return df_with_grosses
+
+
+def analyze_producer_financials(df_with_grosses):
+    """Gross and ticket-price aggregates per producer."""
+    # Same explode+groupby shape as analyze_individual_producers: the
+    # per-(show, producer) work runs in pandas' C aggregation paths
+    # instead of an iterrows loop feeding nested Python lists.
+    valid = df_with_grosses.dropna(subset=['producer_names', 'Total_Gross'])
+    split = valid['producer_names'].str.split(r'\s*;\s*', regex=True)
+    long = valid[['Total_Gross', 'Avg_Ticket_Price']].assign(producer=split)
+    long = long.explode('producer')
+    long = long[long['producer'].astype(bool)]
+
+    financial_df = long.groupby('producer', sort=False).agg(
+        total_shows_with_data=('Total_Gross', 'size'),
+        total_gross=('Total_Gross', 'sum'),
+        avg_ticket_price=('Avg_Ticket_Price', 'mean'),
+    ).reset_index().rename(columns={'producer': 'producer_name'})
+    financial_df['avg_gross_per_show'] = (
+        financial_df['total_gross']
+        / financial_df['total_shows_with_data'])
+    financial_df = financial_df[
+        ['producer_name', 'total_shows_with_data', 'total_gross',
+         'avg_gross_per_show', 'avg_ticket_price']].sort_values(
+        'total_gross', ascending=False)
+    financial_df.to_csv(RESULTS_DIR / 'producer_financials.csv', index=False)
+
+    financial_df_filtered = financial_df[
+        financial_df['total_shows_with_data'] >= 3]
+    logger.info("=== Top producers by gross (3+ shows with data) ===")
+    for row in financial_df_filtered.head(20).itertuples(index=False):
+        logger.info("%-50s | $%.0fM over %d shows", row.producer_name,
+                    row.total_gross / 1e6, row.total_shows_with_data)
+    return financial_df
+
+
+def create_producer_bubble_charts(df_with_grosses, output_suffix='all'):
+    """Bubble charts of producer portfolio size vs gross performance."""
+    # Long-form (show, producer) frame via explode, then one grouped
+    # aggregation - all the per-producer math stays in pandas' C paths.
+    tmp = df_with_grosses.assign(
+        producer=df_with_grosses['producer_names'].fillna('').str.split(';'))
+    tmp = tmp.explode('producer')
+    tmp['producer'] = tmp['producer'].str.strip()
+    tmp = tmp[tmp['producer'].astype(bool)]
+    tmp = tmp.dropna(subset=['Total_Gross'])
+
+    producer_df = tmp.groupby('producer', sort=False).agg(
+        show_count=('show_name', 'nunique'),
+        total_gross=('Total_Gross', 'sum'),
+        avg_weekly_gross=('Avg_Weekly_Gross', 'mean'),
+        win_rate=('tony_win', 'mean'),
+    ).reset_index()
+
+    top = producer_df.sort_values('total_gross', ascending=False).head(25)
+    if top.empty:
+        logger.info("No financial data for bubble charts (%s)", output_suffix)
+        return
+
+    def annotate_bubbles(ax, xs, ys):
+        for producer, x, y in zip(top['producer'], xs, ys):
+            ax.annotate(producer, (x, y), fontsize=8, alpha=0.8)
+
+    # One figure for both charts: the 16x12 Agg canvas is allocated once
+    # and cleared between saves rather than rebuilt.
+    fig, ax = plt.subplots(figsize=(16, 12))
+
+    # Chart 1: portfolio size vs total gross.
+    scatter = ax.scatter(top['show_count'], top['total_gross'] / 1e6,
+                         s=top['win_rate'] * 2000 + 100,
+                         c=top['avg_weekly_gross'], cmap='viridis', alpha=0.6)
+    annotate_bubbles(ax, top['show_count'], top['total_gross'] / 1e6)
+    cbar = fig.colorbar(scatter, ax=ax, label='Avg weekly gross ($)')
+    ax.set_xlabel('Number of shows')
+    ax.set_ylabel('Total gross ($M)')
+    ax.set_title(f'Producer portfolios ({output_suffix}) - '
+                 'bubble size = Tony win rate')
+    fig.savefig(FIGURES_DIR / f'producer_bubbles_gross_{output_suffix}.png',
+                dpi=150, bbox_inches='tight')
+
+    cbar.remove()
+    ax.clear()
+
+    # Chart 2: weekly gross vs win rate.
+    scatter = ax.scatter(top['avg_weekly_gross'] / 1e3,
+                         top['win_rate'] * 100,
+                         s=top['show_count'] * 60 + 40,
+                         c=top['total_gross'], cmap='plasma', alpha=0.6)
+    annotate_bubbles(ax, top['avg_weekly_gross'] / 1e3,
+                     top['win_rate'] * 100)
+    cbar = fig.colorbar(scatter, ax=ax, label='Total gross ($)')
+    ax.set_xlabel('Avg weekly gross ($K)')
+    ax.set_ylabel('Tony win rate (%)')
+    ax.set_title(f'Weekly gross vs Tony success ({output_suffix}) - '
+                 'bubble size = number of shows')
+    fig.savefig(FIGURES_DIR / f'producer_bubbles_winrate_{output_suffix}.png',
+                dpi=150, bbox_inches='tight')
+    plt.close(fig)
+
+
+def save_results(df):
+    """Write the cleaned analysis frame and a plain-text summary."""
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    # Parquet is the fast path for downstream loads: columnar, typed, and
+    # zstd-compressed, so no per-cell text formatting on either side. The
+    # CSV still ships alongside it because the report generator's lazy
+    # scan (and its no-pyarrow fallback) read the CSV.
+    try:
+        df.to_parquet(RESULTS_DIR / 'producer_tony_analysis.parquet',
+                      compression='zstd', index=False)
+    except ImportError:
+        logger.info("No parquet engine installed; CSV only")
+    df.to_csv(RESULTS_DIR / 'producer_tony_analysis.csv', index=False)
+
+    # One column scan; the other three numbers are algebra on n and w.
+    n = len(df)
+    w = int(df['tony_win'].sum())
+    parts = [
+        "Producer count vs Tony outcome\n",
+        "==============================\n",
+        f"Shows analyzed: {n}\n",
+        f"Winners: {w}\n",
+        f"Non-winners: {n - w}\n",
+        f"Win rate: {w / n * 100:.1f}%\n",
+    ]
+    with open(RESULTS_DIR / 'analysis_summary.txt', 'w',
+              buffering=1 << 20, newline='\n', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+
+    df, grosses_df = load_and_merge_data()
+    df_clean = clean_data(df)
+
+    # One split feeds every downstream consumer; no function re-derives
+    # the winner/non-winner groups from the frame.
+    y = df_clean['tony_win'].to_numpy(np.int8)
+    x = df_clean['num_total_producers'].to_numpy(np.float64)
+    win_mask = y == 1
+    winners = x[win_mask]
+    non_winners = x[~win_mask]
+
+    descriptive_stats(winners, non_winners)
+    statistical_tests(winners, non_winners)
+    b0, b1 = logistic_regression(x, y)
+    create_visualizations(x, win_mask, b0, b1)
+
+    analyze_tony_wins_by_year(df_clean)
+    analyze_producer_trends(df_clean)
+    analyze_individual_producers(df_clean)
+
+    if grosses_df is not None:
+        df_with_grosses = add_show_financial_metrics(df_clean, grosses_df)
+        analyze_producer_financials(df_with_grosses)
+        create_producer_bubble_charts(df_with_grosses, 'all')
+        create_producer_bubble_charts(
+            df_with_grosses[df_with_grosses['production_year'] >= 2021],
+            'post_pandemic')
+
+    save_results(df_clean)
+
+
+if __name__ == '__main__':
+    main()